@@ -16,8 +16,7 @@ from ..mobject.types.vectorized_mobject import VGroup
 from ..utils.bezier import interpolate
 from ..utils.color import LIGHT_GREY
 from ..utils.config_ops import merge_dicts_recursively
-from ..utils.simple_functions import fdiv
-from ..utils.space_ops import normalize
+from ..utils.space_ops import rotate_vector
 
 if TYPE_CHECKING:
     from manim.mobject.mobject import Mobject
@@ -94,7 +93,7 @@ class NumberLine(Line):
                     include_numbers=True,
                     number_scale_value=0.5,
                 )
-                [num6] = [num for num in l1.numbers if num.number == 6]
+                num6 = l1.get_number(6)
                 num6.set_color(RED)
                 l1.add(num6)
 
@@ -150,7 +149,7 @@ class NumberLine(Line):
         # temp, because DecimalNumber() needs to be updated
         number_scale_value=0.75,
         exclude_origin_tick=False,
-        **kwargs
+        **kwargs,
     ):
         # avoid mutable arguments in defaults
         if numbers_to_exclude is None:
@@ -198,6 +197,9 @@ class NumberLine(Line):
         self.numbers_to_exclude = numbers_to_exclude
         self.numbers_to_include = numbers_to_include
         self.number_scale_value = number_scale_value
+        # computed lazily by get_tick_range, shared by add_ticks and add_numbers
+        self._tick_range = None
+        self.numbers_by_value = {}
 
         super().__init__(
             self.x_min * RIGHT,
@@ -218,10 +220,14 @@ class NumberLine(Line):
             self.add_tip()
             self.tip.set_stroke(self.stroke_color, self.stroke_width)
 
+        # rotate before adding the ticks, which are then created along the
+        # rotated line instead of being rotated a second time
+        if self.rotation:
+            self.rotate(self.rotation)
+
         if self.include_ticks:
             self.add_ticks()
 
-        self.rotate(self.rotation)
         if self.include_numbers or self.numbers_to_include is not None:
             self.add_numbers(
                 x_values=self.numbers_to_include, excluding=self.numbers_to_exclude
@@ -234,29 +240,59 @@ class NumberLine(Line):
         return self.rotate(angle, axis, about_point=self.n2p(number), **kwargs)
 
     def add_ticks(self):
-        ticks = VGroup()
-        elongated_tick_size = self.tick_size * self.longer_tick_multiple
-        for x in self.get_tick_range():
-            size = self.tick_size
-            if x in self.numbers_with_elongated_ticks:
-                size = elongated_tick_size
-            ticks.add(self.get_tick(x, size))
+        ticks = VGroup(
+            *[Line(start, end) for start, end in zip(*self._get_tick_endpoints())]
+        )
+        ticks.set_stroke(
+            self.get_stroke_color(), self.get_stroke_width(), self.get_stroke_opacity()
+        )
         self.add(ticks)
         self.ticks = ticks
 
+    def _get_tick_endpoints(self):
+        """Returns the start and end points of all ticks as two ``(N, 3)`` arrays.
+
+        Tick sizes and positions are computed in one pass over the tick range,
+        instead of rotating and moving a fresh line for every tick.
+        """
+        tick_range = self.get_tick_range()
+        elongated = {round(float(x), 9) for x in self.numbers_with_elongated_ticks}
+        is_elongated = np.fromiter(
+            (round(x, 9) in elongated for x in tick_range.tolist()),
+            dtype=bool,
+            count=len(tick_range),
+        )
+        sizes = np.where(
+            is_elongated, self.tick_size * self.longer_tick_multiple, self.tick_size
+        )
+        centers = self.number_to_point_array(tick_range)
+        offsets = sizes[:, np.newaxis] * rotate_vector(UP, self.get_angle())
+        return centers - offsets, centers + offsets
+
     def get_tick(self, x, size=None):
         if size is None:
             size = self.tick_size
-        result = Line(size * DOWN, size * UP)
-        result.rotate(self.get_angle())
-        result.move_to(self.number_to_point(x))
-        result.match_style(self)
+        center = self.number_to_point(x)
+        offset = size * rotate_vector(UP, self.get_angle())
+        result = Line(center - offset, center + offset)
+        result.set_stroke(
+            self.get_stroke_color(), self.get_stroke_width(), self.get_stroke_opacity()
+        )
         return result
 
     def get_tick_marks(self):
         return VGroup(self.ticks)
 
     def get_tick_range(self):
+        if self._tick_range is None:
+            self._tick_range = self._compute_tick_range()
+            # the cached array is shared with every caller
+            self._tick_range.setflags(write=False)
+        return self._tick_range
+
+    def _compute_tick_range(self):
+        # Tick values stay in float64: they become the values of the number
+        # labels and the points of the tick lines, which are float64 anyway.
         if self.include_tip:
             x_max = self.x_max
         else:
@@ -264,32 +300,77 @@ class NumberLine(Line):
 
         # Handle cases where min and max are both positive or both negative
         if self.x_min < x_max < 0 or self.x_max > self.x_min > 0:
-            return np.arange(self.x_min, x_max, self.x_step)
+            return np.arange(self.x_min, x_max, self.x_step, dtype=np.float64)
 
         start_point = 0
         if self.exclude_origin_tick:
             start_point += self.x_step
 
-        x_min_segment = (
-            np.arange(start_point, np.abs(self.x_min) + 1e-6, self.x_step) * -1
+        # Both segments grow outwards from ``start_point``, so they are sorted and
+        # disjoint by construction and can be written into a single buffer.
+        n_pos = max(int(np.ceil((x_max - start_point) / self.x_step)), 0)
+        n_neg = max(
+            int(np.ceil((np.abs(self.x_min) + 1e-6 - start_point) / self.x_step)), 0
         )
-        x_max_segment = np.arange(start_point, x_max, self.x_step)
-
-        return np.unique(np.concatenate((x_min_segment, x_max_segment)))
+        # the origin belongs to the positive segment unless that one is empty
+        neg_start = 1 if start_point == 0 and n_pos > 0 else 0
+        n_neg = max(n_neg - neg_start, 0)
+
+        tick_range = np.empty(n_neg + n_pos, dtype=np.float64)
+        tick_range[:n_neg] = -(
+            start_point
+            + self.x_step * np.arange(neg_start + n_neg - 1, neg_start - 1, -1)
+        )
+        tick_range[n_neg:] = start_point + self.x_step * np.arange(n_pos)
+        return tick_range
 
     def number_to_point(self, number):
         alpha = float(number - self.x_min) / (self.x_max - self.x_min)
         return interpolate(self.get_start(), self.get_end(), alpha)
 
+    def number_to_point_array(self, numbers):
+        """Vectorized version of :meth:`number_to_point`.
+
+        Parameters
+        ----------
+        numbers
+            A sequence of ``N`` numbers on the line.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            An ``(N, 3)`` array with the corresponding points.
+        """
+        numbers = np.asarray(numbers, dtype=np.float64)
+        alphas = (numbers - self.x_min) / (self.x_max - self.x_min)
+        start, end = self.get_start(), self.get_end()
+        return start + alphas[:, np.newaxis] * (end - start)
+
     def point_to_number(self, point):
         start, end = self.get_start_and_end()
-        unit_vect = normalize(end - start)
-        proportion = fdiv(
-            np.dot(point - start, unit_vect),
-            np.dot(end - start, unit_vect),
-        )
+        vect = end - start
+        proportion = np.dot(point - start, vect) / np.dot(vect, vect)
         return interpolate(self.x_min, self.x_max, proportion)
 
+    def points_to_numbers(self, points):
+        """Vectorized version of :meth:`point_to_number`.
+
+        Parameters
+        ----------
+        points
+            An ``(N, 3)`` array of points.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The ``N`` numbers corresponding to the projections of the points
+            onto the line.
+        """
+        start, end = self.get_start_and_end()
+        vect = end - start
+        proportions = (np.asarray(points) - start) @ vect / np.dot(vect, vect)
+        return self.x_min + proportions * (self.x_max - self.x_min)
+
     def n2p(self, number):
         """Abbreviation for number_to_point"""
         return self.number_to_point(number)
@@ -305,9 +386,21 @@ class NumberLine(Line):
         return super().get_unit_vector() * self.unit_size
 
     def get_number_mobject(self, x, direction=None, buff=None, **number_config):
-        number_config = merge_dicts_recursively(
-            self.decimal_number_config, number_config
+        number_config = self._get_number_config(number_config)
+        return self._get_number_mobject(
+            x, self.number_to_point(x), direction, buff, number_config
         )
+
+    def _get_number_config(self, number_config):
+        """Returns ``decimal_number_config`` merged with ``number_config``."""
+        return merge_dicts_recursively(self.decimal_number_config, number_config)
+
+    def _get_number_mobject(
+        self, x, point, direction, buff, number_config, minus_width=None
+    ):
+        """Creates the number mobject for ``x`` next to ``point``, using an
+        already merged ``number_config``. ``minus_width`` can be passed to skip
+        measuring the minus sign of negative numbers."""
         if direction is None:
             direction = self.label_direction
         if buff is None:
@@ -316,36 +409,94 @@ class NumberLine(Line):
         num_mob = DecimalNumber(x, **number_config)
         num_mob.scale(self.number_scale_value)
 
-        num_mob.next_to(self.number_to_point(x), direction=direction, buff=buff)
+        num_mob.next_to(point, direction=direction, buff=buff)
         if x < 0 and self.label_direction[0] == 0:
             # Align without the minus sign
-            num_mob.shift(num_mob[0].get_width() * LEFT / 2)
+            if minus_width is None:
+                minus_width = num_mob[0].get_width()
+            num_mob.shift(minus_width * LEFT / 2)
         return num_mob
 
-    def get_number_mobjects(self, *numbers, **kwargs):
+    def get_number_mobjects(self, *numbers, direction=None, buff=None, **number_config):
         if len(numbers) == 0:
-            numbers = self.default_numbers_to_display()
-        return VGroup([self.get_number_mobject(number, **kwargs) for number in numbers])
+            numbers = self.get_tick_range()
+        number_config = self._get_number_config(number_config)
+        points = self.number_to_point_array(numbers)
+        return VGroup(
+            *[
+                self._get_number_mobject(number, point, direction, buff, number_config)
+                for number, point in zip(numbers, points)
+            ]
+        )
 
     def get_labels(self):
         return self.get_number_mobjects()
 
-    def add_numbers(self, x_values=None, excluding=None, **kwargs):
+    def add_numbers(
+        self, x_values=None, excluding=None, direction=None, buff=None, **number_config
+    ):
+        """Adds :class:`~.DecimalNumber` mobjects to the :class:`~.NumberLine`.
+
+        ``x_values`` are converted to floats, and every value within ``1e-9`` of
+        a number in ``excluding`` is skipped, so e.g. excluding ``0.3`` also
+        drops the ``0.30000000000000004`` tick of a ``0.1`` step range.
+        """
         if x_values is None:
             x_values = self.get_tick_range()
 
         if excluding is None:
             excluding = self.numbers_to_exclude
 
-        numbers = VGroup()
-        for x in x_values:
-            if x in excluding:
-                continue
-            numbers.add(self.get_number_mobject(x, **kwargs))
+        number_config = self._get_number_config(number_config)
+        x_values = np.asarray(x_values, dtype=np.float64)
+        excluding = np.asarray(excluding, dtype=np.float64)
+        # drop excluded values up front instead of testing each one in the loop
+        keep = (np.abs(x_values[:, np.newaxis] - excluding) > 1e-9).all(axis=1)
+        x_values = x_values[keep]
+
+        # all minus signs share the same config and thus the same width,
+        # so only the first one needs to be measured
+        minus_width = None
+        num_mobs = []
+        numbers_by_value = {}
+        for x, point in zip(x_values.tolist(), self.number_to_point_array(x_values)):
+            key = round(x, 9)
+            num_mob = self._get_number_mobject(
+                x, point, direction, buff, number_config, minus_width
+            )
+            if x < 0 and minus_width is None:
+                minus_width = num_mob[0].get_width()
+            num_mobs.append(num_mob)
+            numbers_by_value[key] = num_mob
+        numbers = VGroup(*num_mobs)
         self.add(numbers)
         self.numbers = numbers
+        self.numbers_by_value = numbers_by_value
         return self
 
+    def get_number(self, x):
+        """Returns the number mobject that :meth:`add_numbers` placed at ``x``.
+
+        Parameters
+        ----------
+        x
+            The value of the number on the line.
+
+        Returns
+        -------
+        :class:`~.DecimalNumber`
+            The number mobject.
+
+        Raises
+        ------
+        ValueError
+            If no number was added at ``x``.
+        """
+        key = round(float(x), 9)
+        if key not in self.numbers_by_value:
+            raise ValueError(f"The number line does not contain a number at {x}")
+        return self.numbers_by_value[key]
+
     def add_labels(
         self,
         dict_values: Dict[float, Union[str, float, "Mobject"]],
@@ -358,14 +509,16 @@ class NumberLine(Line):
         if buff is None:
             buff = self.line_to_number_buff
 
-        labels = VGroup()
-        for x, label in dict_values.items():
+        label_mobs = []
+        points = self.number_to_point_array(list(dict_values.keys()))
+        for label, point in zip(dict_values.values(), points):
 
             label = self.create_label_tex(label)
             label.scale(self.number_scale_value)
-            label.next_to(self.number_to_point(x), direction=direction, buff=buff)
-            labels.add(label)
+            label.next_to(point, direction=direction, buff=buff)
+            label_mobs.append(label)
 
+        labels = VGroup(*label_mobs)
         self.labels = labels
         self.add(labels)
         return self
@@ -398,12 +551,16 @@ class NumberLine(Line):
 
 
 class UnitInterval(NumberLine):
+    # the tick range of the default (0, 1, 0.1) range, shared by all instances
+    _TICK_XS = np.round(np.arange(0, 1.0 + 1e-6, 0.1), 10)
+    _TICK_XS.setflags(write=False)
+
     def __init__(
         self,
         unit_size=10,
         numbers_with_elongated_ticks=None,
         decimal_number_config=None,
-        **kwargs
+        **kwargs,
     ):
         numbers_with_elongated_ticks = (
             [0, 1]
@@ -426,3 +583,8 @@ class UnitInterval(NumberLine):
             decimal_number_config=decimal_number_config,
             **kwargs,
         )
+
+    def _compute_tick_range(self):
+        if self.include_tip or self.exclude_origin_tick:
+            return super()._compute_tick_range()
+        return self._TICK_XS
@@ -1,6 +1,7 @@
 import numpy as np
+import pytest
 
-from manim import NumberLine
+from manim import DEGREES, PI, NumberLine
 from manim.mobject.numbers import Integer
 
 
@@ -63,3 +64,65 @@ def test_add_labels():
     assert (
         actual_label_length == expected_label_length
     ), f"Expected a VGroup with {expected_label_length} integers but got {actual_label_length}."
+
+
+def test_get_number():
+    num_line = NumberLine(x_range=[-4, 4], include_numbers=True, numbers_to_exclude=[2])
+    assert num_line.get_number(3).number == 3
+    assert num_line.get_number(-1.0).number == -1
+    assert 2 not in num_line.numbers_by_value
+    with pytest.raises(ValueError):
+        num_line.get_number(2)
+    with pytest.raises(ValueError):
+        NumberLine(x_range=[-4, 4]).get_number(1)
+
+
+def test_points_to_numbers():
+    num_line = NumberLine(x_range=[-3, 5], length=6, rotation=PI / 6)
+    numbers = np.array([-3, -1.5, 0, 2.25, 5])
+    points = num_line.number_to_point_array(numbers)
+    np.testing.assert_allclose(num_line.points_to_numbers(points), numbers)
+    np.testing.assert_allclose(
+        num_line.points_to_numbers(points),
+        [num_line.point_to_number(point) for point in points],
+    )
+
+
+def test_get_number_mobjects():
+    num_line = NumberLine(x_range=[-3, 3])
+    labels = num_line.get_labels()
+    assert len(labels) == len(num_line.get_tick_range())
+    assert [label.number for label in labels] == list(num_line.get_tick_range())
+
+    numbers = num_line.get_number_mobjects(-2, 1)
+    assert [num.number for num in numbers] == [-2, 1]
+    np.testing.assert_allclose(
+        numbers[1].get_center()[0], num_line.number_to_point(1)[0]
+    )
+
+
+def test_rotation_matches_rotating_afterwards():
+    """Checks that ticks and tip of a line built with ``rotation`` end up where
+    they would be when rotating the finished line about its center."""
+    angle = 30 * DEGREES
+    rotated = NumberLine(x_range=[-3, 3], include_tip=True, rotation=angle)
+    expected = NumberLine(x_range=[-3, 3], include_tip=True)
+    expected.rotate(angle, about_point=expected.get_center())
+
+    assert len(rotated.ticks) == len(expected.ticks)
+    for tick, expected_tick in zip(rotated.ticks, expected.ticks):
+        np.testing.assert_allclose(
+            tick.get_start(), expected_tick.get_start(), atol=1e-9
+        )
+        np.testing.assert_allclose(tick.get_end(), expected_tick.get_end(), atol=1e-9)
+    np.testing.assert_allclose(rotated.tip.points, expected.tip.points, atol=1e-9)
+    np.testing.assert_allclose(rotated.get_center(), expected.get_center(), atol=1e-9)
+
+
+def test_add_numbers_excludes_with_tolerance():
+    num_line = NumberLine(x_range=[0, 1, 0.1], numbers_to_exclude=[0.3])
+    num_line.add_numbers()
+    values = [num.number for num in num_line.numbers]
+    assert len(values) == len(num_line.get_tick_range()) - 1
+    assert all(abs(value - 0.3) > 1e-9 for value in values)
+    assert all(isinstance(value, float) for value in values)
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from manim import PI, Axes, NumberLine
 
@@ -52,3 +53,11 @@ def test_ticks_generated_from_origin_for_axes():
     assert 0 not in y_axis_range
     assert 1 in y_axis_range
     assert 2 in y_axis_range
+
+
+def test_tick_range_is_read_only():
+    axis = NumberLine(x_range=[-3, 3])
+    ticks = axis.get_tick_range()
+    assert ticks is axis.get_tick_range()
+    with pytest.raises(ValueError):
+        ticks[0] = 10